@@ -1,12 +1,167 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from utils import EstimatedCountPaginator
 from .models import *
 
 
-admin.site.register(Manufacturer)
-admin.site.register(Season)
-admin.site.register()
-admin.site.register()
-admin.site.register()
-admin.site.register()
-admin.site.register()
-admin.site.register()
+class SelectRelatedChangeList(ChangeList):
+    """ChangeList, который применяет list_select_related и поверх select_related из ModelAdmin.get_queryset"""
+
+    def get_queryset(self, request):
+        return self.apply_select_related(super().get_queryset(request))
+
+
+class BaseModelAdmin(admin.ModelAdmin):
+    """Общие настройки списков для больших таблиц"""
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    list_per_page = 50
+    ordering = ('-pk',)
+
+    def get_changelist(self, request, **kwargs):
+        return SelectRelatedChangeList
+
+
+def make_order_status_action(status, label):
+    def action(modeladmin, request, queryset):
+        updated = queryset.update(status=status)
+        modeladmin.message_user(request, f"Статус «{label}» установлен для заказов: {updated}")
+
+    action.__name__ = f"set_status_{status}"
+    action.short_description = f"Установить статус «{label}»"
+    return action
+
+
+@admin.register(Manufacturer)
+class ManufacturerAdmin(BaseModelAdmin):
+    list_display = ('name', 'country')
+    search_fields = ('name',)
+    prepopulated_fields = {'slug': ('name',)}
+
+
+@admin.register(Season)
+class SeasonAdmin(BaseModelAdmin):
+    list_display = ('name',)
+    search_fields = ('name',)
+
+
+@admin.register(Products)
+class ProductsAdmin(BaseModelAdmin):
+    list_display = ('id', 'name', 'manufacturer', 'season', 'price', 'stock', 'offer_of_the_week')
+    list_display_links = ('id', 'name')
+    list_select_related = ('manufacturer', 'season')
+    list_filter = ('offer_of_the_week', 'season', 'manufacturer')
+    search_fields = ('name',)
+    autocomplete_fields = ('manufacturer', 'season')
+    prepopulated_fields = {'slug': ('name',)}
+    actions = ('mark_out_of_stock', 'set_offer_of_the_week', 'unset_offer_of_the_week')
+
+    def get_queryset(self, request):
+        # __str__ обращается к производителю и сезону, в том числе в выдаче автодополнения
+        return super().get_queryset(request).select_related('manufacturer', 'season')
+
+    def mark_out_of_stock(self, request, queryset):
+        updated = queryset.update(stock=0)
+        self.message_user(request, f"Сняты с наличия товары: {updated}")
+    mark_out_of_stock.short_description = 'Обнулить наличие на складе'
+
+    def set_offer_of_the_week(self, request, queryset):
+        updated = queryset.update(offer_of_the_week=True)
+        self.message_user(request, f"Добавлены в предложение недели товары: {updated}")
+    set_offer_of_the_week.short_description = 'Добавить в предложение недели'
+
+    def unset_offer_of_the_week(self, request, queryset):
+        updated = queryset.update(offer_of_the_week=False)
+        self.message_user(request, f"Убраны из предложения недели товары: {updated}")
+    unset_offer_of_the_week.short_description = 'Убрать из предложения недели'
+
+
+@admin.register(CartProduct)
+class CartProductAdmin(BaseModelAdmin):
+    list_display = ('id', 'user', 'cart_id_display', 'product', 'qty', 'final_price')
+    list_select_related = ('user__user', 'product__manufacturer', 'product__season')
+    search_fields = ('user__user__username', 'product__name')
+    autocomplete_fields = ('user', 'cart', 'product')
+
+    def get_queryset(self, request):
+        # __str__ берёт название товара, в том числе в выдаче автодополнения
+        return super().get_queryset(request).select_related('product')
+
+    def cart_id_display(self, obj):
+        # Cart.__str__ — это id, так что корзину не нужно ни подгружать, ни присоединять
+        return obj.cart_id
+    cart_id_display.short_description = 'Корзина'
+    cart_id_display.admin_order_field = 'cart_id'
+
+
+@admin.register(Cart)
+class CartAdmin(BaseModelAdmin):
+    list_display = ('id', 'owner', 'total_products', 'final_price', 'in_order', 'for_anonymous_user')
+    list_select_related = ('owner__user',)
+    list_filter = ('in_order', 'for_anonymous_user')
+    search_fields = ('owner__user__username', '^owner__phone')
+    autocomplete_fields = ('owner', 'products')
+
+
+@admin.register(Order)
+class OrderAdmin(BaseModelAdmin):
+    list_display = (
+        'id', 'customer', 'first_name', 'last_name', 'phone', 'status', 'buying_type', 'created_at', 'order_date'
+    )
+    list_select_related = ('customer__user',)
+    list_filter = ('status', 'buying_type', 'created_at')
+    search_fields = ('^phone', '^last_name')
+    autocomplete_fields = ('customer', 'cart')
+    actions = [make_order_status_action(status, label) for status, label in Order.STATUS_CHOICE]
+
+
+@admin.register(Customer)
+class CustomerAdmin(BaseModelAdmin):
+    list_display = ('id', 'user', 'phone', 'address', 'is_active')
+    list_select_related = ('user',)
+    list_filter = ('is_active',)
+    search_fields = ('user__username', '^phone')
+    autocomplete_fields = ('user', 'customer_order', 'wishlist')
+
+    def get_queryset(self, request):
+        # __str__ берёт имя пользователя, в том числе в выдаче автодополнения
+        return super().get_queryset(request).select_related('user')
+
+
+@admin.register(Notifications)
+class NotificationsAdmin(BaseModelAdmin):
+    list_display = ('id', 'recipient', 'read')
+    list_select_related = ('recipient__user',)
+    list_filter = ('read',)
+    search_fields = ('recipient__user__username',)
+    autocomplete_fields = ('recipient',)
+    actions = ('mark_read', 'mark_unread')
+
+    def mark_read(self, request, queryset):
+        updated = queryset.update(read=True)
+        self.message_user(request, f"Отмечены прочитанными уведомления: {updated}")
+    mark_read.short_description = 'Отметить прочитанными'
+
+    def mark_unread(self, request, queryset):
+        updated = queryset.update(read=False)
+        self.message_user(request, f"Отмечены непрочитанными уведомления: {updated}")
+    mark_unread.short_description = 'Отметить непрочитанными'
+
+
+@admin.register(ImageGallery)
+class ImageGalleryAdmin(BaseModelAdmin):
+    list_display = ('id', 'content_type', 'object_id', 'use_in_slider')
+    list_select_related = ('content_type',)
+    list_filter = ('use_in_slider', 'content_type')
+    actions = ('add_to_slider', 'remove_from_slider')
+
+    def add_to_slider(self, request, queryset):
+        updated = queryset.update(use_in_slider=True)
+        self.message_user(request, f"Добавлены в слайдер изображения: {updated}")
+    add_to_slider.short_description = 'Показывать в слайдере'
+
+    def remove_from_slider(self, request, queryset):
+        updated = queryset.update(use_in_slider=False)
+        self.message_user(request, f"Убраны из слайдера изображения: {updated}")
+    remove_from_slider.short_description = 'Не показывать в слайдере'
@@ -0,0 +1,58 @@
+# Generated by Django 3.1.7 on 2026-10-19 09:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kids', '0002_auto_20211121_2251'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='cart',
+            name='for_anonymous_user',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='cart',
+            name='in_order',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='customer',
+            name='is_active',
+            field=models.BooleanField(db_index=True, default=False, verbose_name='В сети '),
+        ),
+        migrations.AlterField(
+            model_name='imagegallery',
+            name='use_in_slider',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='notifications',
+            name='read',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='buying_type',
+            field=models.CharField(choices=[('self', 'Самовывоз'), ('delivery', 'Доставка')], db_index=True, default='self', max_length=100, verbose_name='Тип заказа'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='created_at',
+            field=models.DateField(auto_now=True, db_index=True, verbose_name='Дата заказа'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='status',
+            field=models.CharField(choices=[('new', 'Новый заказ'), ('in_progress', 'Заказ в обработке'), ('is_ready', 'Заказ готов'), ('completed', 'Заказ отдан')], db_index=True, default='new', max_length=100, verbose_name='Статус заказа'),
+        ),
+        migrations.AlterField(
+            model_name='products',
+            name='offer_of_the_week',
+            field=models.BooleanField(db_index=True, default=False, verbose_name='Предложение недели '),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.1.7 on 2026-10-19 09:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('kids', '0003_admin_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='cartproduct',
+            name='product',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='kids.products', verbose_name='Товар'),
+        ),
+        migrations.AlterField(
+            model_name='cartproduct',
+            name='content_type',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, to='contenttypes.contenttype'),
+        ),
+        migrations.AlterField(
+            model_name='cartproduct',
+            name='object_id',
+            field=models.PositiveIntegerField(null=True),
+        ),
+    ]
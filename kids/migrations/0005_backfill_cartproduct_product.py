@@ -0,0 +1,100 @@
+from django.db import migrations, transaction
+from django.db.models import Count, F, Max, Sum
+
+CHUNK_SIZE = 10000
+
+
+def get_max_pk(queryset):
+    return queryset.aggregate(max_pk=Max('pk'))['max_pk'] or 0
+
+
+def chunk_ranges(queryset):
+    # Старый код может вставлять строки без product, пока идёт перенос: дойдя до конца,
+    # перечитываем Max('pk') и обрабатываем появившиеся строки.
+    # Записи старым кодом между этой миграцией и 0006 всё равно нужно остановить.
+    start = 0
+    max_pk = get_max_pk(queryset)
+    while start <= max_pk:
+        yield start, start + CHUNK_SIZE
+        start += CHUNK_SIZE
+        if start > max_pk:
+            max_pk = get_max_pk(queryset)
+
+
+def recalculate_carts(Cart, cart_ids, db_alias):
+    carts = Cart.objects.using(db_alias).filter(pk__in=cart_ids).annotate(
+        products_count=Count('products'), products_price=Sum('products__final_price')
+    )
+    for cart in carts:
+        cart.total_products = cart.products_count
+        cart.final_price = cart.products_price or 0
+    Cart.objects.using(db_alias).bulk_update(carts, ['total_products', 'final_price'])
+
+
+def forwards(apps, schema_editor):
+    """Переносит ссылки на товар из content_type/object_id в product, пачками по первичному ключу"""
+    db_alias = schema_editor.connection.alias
+    CartProduct = apps.get_model('kids', 'CartProduct')
+    Cart = apps.get_model('kids', 'Cart')
+    Products = apps.get_model('kids', 'Products')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+
+    content_type = ContentType.objects.using(db_alias).filter(app_label='kids', model='products').first()
+    queryset = CartProduct.objects.using(db_alias)
+    deleted_total = 0
+    recalculated_carts = set()
+    for start, end in chunk_ranges(queryset):
+        chunk = queryset.filter(pk__gte=start, pk__lt=end, product__isnull=True)
+        with transaction.atomic(using=db_alias):
+            if content_type is not None:
+                chunk.filter(
+                    content_type=content_type,
+                    object_id__in=Products.objects.using(db_alias).values('pk'),
+                ).update(product_id=F('object_id'))
+            # Товары для корзины, ссылающиеся на удалённые товары, при FK удалились бы каскадом.
+            # Корзины, где они лежали, пересчитываем, чтобы итоги не учитывали удалённые позиции
+            orphans = chunk.filter(product__isnull=True)
+            orphan_ids = list(orphans.values_list('pk', flat=True))
+            if not orphan_ids:
+                continue
+            cart_ids = set(orphans.values_list('cart_id', flat=True))
+            cart_ids.update(
+                Cart.products.through.objects.using(db_alias)
+                .filter(cartproduct_id__in=orphan_ids)
+                .values_list('cart_id', flat=True)
+            )
+            queryset.filter(pk__in=orphan_ids).delete()
+            recalculate_carts(Cart, cart_ids, db_alias)
+            deleted_total += len(orphan_ids)
+            recalculated_carts.update(cart_ids)
+    if deleted_total:
+        print(
+            f"\n  Удалено товаров для корзины без существующего товара: {deleted_total}, "
+            f"пересчитано корзин: {len(recalculated_carts)}"
+        )
+
+
+def backwards(apps, schema_editor):
+    db_alias = schema_editor.connection.alias
+    CartProduct = apps.get_model('kids', 'CartProduct')
+    ContentType = apps.get_model('contenttypes', 'ContentType')
+
+    content_type, _ = ContentType.objects.using(db_alias).get_or_create(app_label='kids', model='products')
+    queryset = CartProduct.objects.using(db_alias)
+    for start, end in chunk_ranges(queryset):
+        with transaction.atomic(using=db_alias):
+            queryset.filter(pk__gte=start, pk__lt=end).update(content_type=content_type, object_id=F('product_id'))
+
+
+class Migration(migrations.Migration):
+    # Каждая пачка коммитится отдельно, чтобы не держать блокировки на всей таблице
+    atomic = False
+
+    dependencies = [
+        ('contenttypes', '0002_remove_content_type_name'),
+        ('kids', '0004_cartproduct_product'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
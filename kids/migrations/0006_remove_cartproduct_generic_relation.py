@@ -0,0 +1,27 @@
+# Generated by Django 3.1.7 on 2026-10-19 09:32
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('kids', '0005_backfill_cartproduct_product'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='cartproduct',
+            name='content_type',
+        ),
+        migrations.RemoveField(
+            model_name='cartproduct',
+            name='object_id',
+        ),
+        migrations.AlterField(
+            model_name='cartproduct',
+            name='product',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='kids.products', verbose_name='Товар'),
+        ),
+    ]
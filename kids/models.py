@@ -53,7 +53,7 @@ class Products(models.Model):
     description = models.TextField(verbose_name='Описание')
     slug = models.SlugField()
     stock = models.IntegerField(default=1, verbose_name='Наличие на складе')
-    offer_of_the_week = models.BooleanField(default=False, verbose_name='Предложение недели ')
+    offer_of_the_week = models.BooleanField(default=False, db_index=True, verbose_name='Предложение недели ')
     release_date = models.DateField(verbose_name='Дата выпуса')
     image = models.ImageField(upload_to=upload_function)
 
@@ -73,16 +73,14 @@ class CartProduct(models.Model):
     user = models.ForeignKey('Customer', verbose_name='Покупатель', on_delete=models.CASCADE)
     cart = models.ForeignKey('Cart', verbose_name='Корзина', on_delete=models.CASCADE)
     final_price = models.DecimalField(max_digits=9, decimal_places=2, verbose_name='Общая цена')
-    object_id = models.PositiveIntegerField()
-    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
-    content_object = GenericForeignKey('content_type', 'object_id')
+    product = models.ForeignKey(Products, on_delete=models.CASCADE, verbose_name='Товар')
     qty = models.PositiveIntegerField(default=1, verbose_name='Количество товара')
 
     def __str__(self):
-        return f"Продукт: {self.content_object.name}(для корзины)"
+        return f"Продукт: {self.product.name}(для корзины)"
 
     def save(self, *args, **kwargs):
-        self.final_price = self.qty * self.content_object.price
+        self.final_price = self.qty * self.product.price
         super().save(*args, **kwargs)
 
     class Meta:
@@ -97,8 +95,8 @@ class Cart(models.Model):
     )
     total_products = models.IntegerField(default=0, verbose_name='Общее количество товара')
     final_price = models.DecimalField(max_digits=9, decimal_places=2, verbose_name='Общая цена')
-    in_order = models.BooleanField(default=False)
-    for_anonymous_user = models.BooleanField(default=False)
+    in_order = models.BooleanField(default=False, db_index=True)
+    for_anonymous_user = models.BooleanField(default=False, db_index=True)
 
     def __str__(self):
         return str(self.id)
@@ -137,11 +135,12 @@ class Order(models.Model):
     phone = models.CharField(max_length=20, verbose_name='Номер телефона')
     address = models.CharField(max_length=255, verbose_name='Адрес')
     cart = models.ForeignKey(Cart, on_delete=models.CASCADE, verbose_name='Корзина')
-    status = models.CharField(max_length=100, choices=STATUS_CHOICE, default=STATUS_NEW, verbose_name='Статус заказа')
-    buying_type = models.CharField(max_length=100, choices=BUYING_TYPE_CHOICE, default=BUYING_TYPE_SELF,
+    status = models.CharField(max_length=100, choices=STATUS_CHOICE, default=STATUS_NEW, db_index=True,
+                              verbose_name='Статус заказа')
+    buying_type = models.CharField(max_length=100, choices=BUYING_TYPE_CHOICE, default=BUYING_TYPE_SELF, db_index=True,
                                    verbose_name='Тип заказа')
     comment = models.TextField(null=True, blank=True, verbose_name='Комментарий')
-    created_at = models.DateField(auto_now=True, verbose_name='Дата заказа')
+    created_at = models.DateField(auto_now=True, db_index=True, verbose_name='Дата заказа')
     order_date = models.DateField(default=timezone.now, verbose_name='Дата получения заказа')
 
     def __str__(self):
@@ -154,7 +153,7 @@ class Order(models.Model):
 
 class Customer(models.Model):
     user = models.OneToOneField(settings.AUTH_USER_MODEL, on_delete=models.CASCADE, verbose_name='Покупатель')
-    is_active = models.BooleanField(default=False, verbose_name='В сети ')
+    is_active = models.BooleanField(default=False, db_index=True, verbose_name='В сети ')
     customer_order = models.ManyToManyField(Order, blank=True, related_name='related_customer',
                                             verbose_name='Заказы покупателя')
     wishlist = models.ManyToManyField(Products, blank=True, verbose_name='Список ожидаемого')
@@ -162,7 +161,7 @@ class Customer(models.Model):
     address = models.CharField(max_length=255, blank=True, verbose_name='Адрес')
 
     def __str__(self):
-        return self.user.name
+        return self.user.username
 
     class Meta:
         verbose_name = 'Покупатель'
@@ -172,7 +171,7 @@ class Customer(models.Model):
 class Notifications(models.Model):
     recipient = models.ForeignKey(Customer, on_delete=models.CASCADE, verbose_name='Получатель')
     text = models.TextField()
-    read = models.BooleanField(default=False)
+    read = models.BooleanField(default=False, db_index=True)
 
     def __str__(self):
         return f"Уведомление для {self.recipient.user.username} | id={self.id}"
@@ -188,7 +187,7 @@ class ImageGallery(models.Model):
     object_id = models.PositiveIntegerField()
     content_object = GenericForeignKey('content_type', 'object_id')
     image = models.ImageField(upload_to=upload_function)
-    use_in_slider = models.BooleanField(default=False)
+    use_in_slider = models.BooleanField(default=False, db_index=True)
 
     def __str__(self):
         return f"Изображение для {self.content_object}"
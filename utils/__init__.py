@@ -1 +1,2 @@
+from .pagination import EstimatedCountPaginator
 from .uploading import upload_function
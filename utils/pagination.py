@@ -0,0 +1,56 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """Пагинатор для больших таблиц: без фильтров берёт оценку числа строк из статистики СУБД вместо COUNT(*)"""
+
+    ESTIMATE_THRESHOLD = 10000
+    is_estimated = False
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = self.get_estimated_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= self.ESTIMATE_THRESHOLD:
+                self.is_estimated = True
+                return estimate
+        return super().count
+
+    def validate_number(self, number):
+        # Оценка может быть меньше реального числа строк: с последней оценочной страницы
+        # переходим на точный COUNT(*), иначе хвост списка обрезается или недоступен
+        if self.is_estimated:
+            try:
+                page_number = int(number)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if page_number >= self.num_pages:
+                    self.use_exact_count()
+        return super().validate_number(number)
+
+    def use_exact_count(self):
+        self.is_estimated = False
+        for name in ('count', 'num_pages', 'page_range'):
+            self.__dict__.pop(name, None)
+        self.count = super().count
+
+    @staticmethod
+    def get_estimated_count(model, using):
+        connection = connections[using]
+        table = model._meta.db_table
+        if connection.vendor == 'postgresql':
+            sql = "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass"
+            params = [connection.ops.quote_name(table)]
+        elif connection.vendor == 'mysql':
+            sql = "SELECT table_rows FROM information_schema.tables WHERE table_schema = DATABASE() AND table_name = %s"
+            params = [table]
+        else:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+        return int(row[0]) if row and row[0] is not None else None